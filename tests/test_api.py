@@ -8,39 +8,58 @@ Tests cover the main endpoints:
 """
 
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from asgi_lifespan import LifespanManager
+from fastapi import HTTPException
+from httpx import ASGITransport, AsyncClient
+from src.app import app, activities, signup_for_activity, unregister_from_activity
+
+
+# Expected substrings of error details
+NOT_FOUND = "not found"
+ALREADY_REGISTERED = "already registered"
+NOT_REGISTERED = "not registered"
+
+
+def err(response):
+    """Return the casefolded error detail of a response"""
+    return response.json()["detail"].casefold()
+
+
+@pytest.fixture(scope="session")
+async def client():
+    """Create one async test client for the whole session
+
+    The app lifespan is entered once here instead of once per test.
+    """
+    async with LifespanManager(app) as manager:
+        transport = ASGITransport(app=manager.app)
+        async with AsyncClient(transport=transport, base_url="http://test") as ac:
+            yield ac
+
+
+@pytest.fixture(scope="session")
+def _pristine_participants():
+    """Snapshot the initial participant lists once per session"""
+    # Only participant lists are mutated by the API, so only snapshot those
+    return {name: tuple(details["participants"]) for name, details in activities.items()}
 
 
 @pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    # Store original state
-    original_activities = {
-        name: {"participants": details["participants"].copy(), **{k: v for k, v in details.items() if k != "participants"}}
-        for name, details in activities.items()
-    }
-    
+def reset_activities(_pristine_participants):
+    """Reset activities data around tests that mutate it"""
     yield
     
-    # Restore original state after test
-    for name, details in original_activities.items():
-        if name in activities:
-            activities[name]["participants"] = details["participants"].copy()
+    # Restore participant lists in place after test
+    for name, participants in _pristine_participants.items():
+        activities[name]["participants"][:] = participants
 
 
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
     
-    def test_get_activities_success(self, client):
+    async def test_get_activities_success(self, client):
         """Test successfully retrieving all activities"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         assert response.status_code == 200
         
         data = response.json()
@@ -55,9 +74,9 @@ class TestGetActivities:
             assert "participants" in activity_details
             assert isinstance(activity_details["participants"], list)
     
-    def test_activities_contain_expected_data(self, client):
+    async def test_activities_contain_expected_data(self, client):
         """Test that activities contain expected fields and data types"""
-        response = client.get("/activities")
+        response = await client.get("/activities")
         data = response.json()
         
         # Check that Soccer Team exists (from initial data)
@@ -70,9 +89,9 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_success(self, client):
+    async def test_signup_success(self, client, reset_activities):
         """Test successful signup for an activity"""
-        response = client.post("/activities/Soccer%20Team/signup?email=test@mergington.edu")
+        response = await client.post("/activities/Soccer Team/signup", params={"email": "test@mergington.edu"})
         assert response.status_code == 200
         
         data = response.json()
@@ -81,41 +100,18 @@ class TestSignupForActivity:
         assert "Soccer Team" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Soccer Team"]["participants"]
-    
-    def test_signup_duplicate_participant(self, client):
-        """Test that signing up twice with same email fails"""
-        email = "duplicate@mergington.edu"
-        
-        # First signup should succeed
-        response1 = client.post(f"/activities/Soccer%20Team/signup?email={email}")
-        assert response1.status_code == 200
-        
-        # Second signup should fail
-        response2 = client.post(f"/activities/Soccer%20Team/signup?email={email}")
-        assert response2.status_code == 400
-        assert "already registered" in response2.json()["detail"].lower()
+        assert "test@mergington.edu" in activities["Soccer Team"]["participants"]
     
-    def test_signup_nonexistent_activity(self, client):
-        """Test signup for non-existent activity fails"""
-        response = client.post("/activities/Nonexistent%20Activity/signup?email=test@mergington.edu")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-    
-    def test_signup_multiple_participants(self, client):
+    async def test_signup_multiple_participants(self, client, reset_activities):
         """Test multiple different participants can sign up"""
         emails = ["user1@mergington.edu", "user2@mergington.edu", "user3@mergington.edu"]
         
         for email in emails:
-            response = client.post(f"/activities/Chess%20Club/signup?email={email}")
+            response = await client.post("/activities/Chess Club/signup", params={"email": email})
             assert response.status_code == 200
         
         # Verify all participants were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        chess_participants = activities_data["Chess Club"]["participants"]
+        chess_participants = activities["Chess Club"]["participants"]
         
         for email in emails:
             assert email in chess_participants
@@ -124,15 +120,15 @@ class TestSignupForActivity:
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_success(self, client):
+    async def test_unregister_success(self, client, reset_activities):
         """Test successfully unregistering from an activity"""
         email = "unregister@mergington.edu"
         
         # First sign up
-        client.post(f"/activities/Art%20Club/signup?email={email}")
+        await client.post("/activities/Art Club/signup", params={"email": email})
         
         # Then unregister
-        response = client.delete(f"/activities/Art%20Club/unregister?email={email}")
+        response = await client.delete("/activities/Art Club/unregister", params={"email": email})
         assert response.status_code == 200
         
         data = response.json()
@@ -140,40 +136,52 @@ class TestUnregisterFromActivity:
         assert email in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data["Art Club"]["participants"]
-    
-    def test_unregister_not_registered(self, client):
-        """Test unregistering when not registered fails"""
-        response = client.delete("/activities/Drama%20Club/unregister?email=notregistered@mergington.edu")
-        assert response.status_code == 400
-        assert "not registered" in response.json()["detail"].lower()
+        assert email not in activities["Art Club"]["participants"]
     
-    def test_unregister_nonexistent_activity(self, client):
-        """Test unregister from non-existent activity fails"""
-        response = client.delete("/activities/Nonexistent%20Activity/unregister?email=test@mergington.edu")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-    
-    def test_unregister_existing_participant(self, client):
+    async def test_unregister_existing_participant(self, client, reset_activities):
         """Test unregistering an existing participant from initial data"""
         # james@mergington.edu is already registered for Soccer Team
-        response = client.delete("/activities/Soccer%20Team/unregister?email=james@mergington.edu")
+        response = await client.delete("/activities/Soccer Team/unregister", params={"email": "james@mergington.edu"})
         assert response.status_code == 200
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "james@mergington.edu" not in activities_data["Soccer Team"]["participants"]
+        assert "james@mergington.edu" not in activities["Soccer Team"]["participants"]
+
+
+class TestErrorPaths:
+    """Tests for signup/unregister requests that are rejected"""
+    
+    async def test_error_response_over_http(self, client):
+        """Test that handler errors reach the client as JSON error responses"""
+        response = await client.post("/activities/Nonexistent Activity/signup", params={"email": "test@mergington.edu"})
+        assert response.status_code == 404
+        assert NOT_FOUND in err(response)
+    
+    @pytest.mark.parametrize("handler,activity_name,email,status,msg", [
+        # Signup for non-existent activity
+        (signup_for_activity, "Nonexistent Activity", "test@mergington.edu", 404, NOT_FOUND),
+        # Unregister from non-existent activity
+        (unregister_from_activity, "Nonexistent Activity", "test@mergington.edu", 404, NOT_FOUND),
+        # james@mergington.edu is already registered for Soccer Team
+        (signup_for_activity, "Soccer Team", "james@mergington.edu", 400, ALREADY_REGISTERED),
+        # Unregister when not registered
+        (unregister_from_activity, "Drama Club", "notregistered@mergington.edu", 400, NOT_REGISTERED),
+    ])
+    def test_error_paths(self, handler, activity_name, email, status, msg):
+        """Test that the handlers reject invalid requests with the right error"""
+        # Call the handler directly; the HTTP wiring is covered above
+        with pytest.raises(HTTPException) as exc_info:
+            handler(activity_name, email)
+        assert exc_info.value.status_code == status
+        assert msg in exc_info.value.detail.casefold()
 
 
 class TestRootEndpoint:
     """Tests for root endpoint"""
     
-    def test_root_redirects(self, client):
+    async def test_root_redirects(self, client):
         """Test that root redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = await client.get("/", follow_redirects=False)
         assert response.status_code == 307  # Temporary redirect
         assert "/static/index.html" in response.headers["location"]
 
@@ -181,44 +189,43 @@ class TestRootEndpoint:
 class TestIntegrationScenarios:
     """Integration tests for complete workflows"""
     
-    def test_signup_and_unregister_workflow(self, client):
+    async def test_signup_and_unregister_workflow(self, client, reset_activities):
         """Test complete workflow: signup -> verify -> unregister -> verify"""
         email = "workflow@mergington.edu"
         activity = "Programming Class"
         
         # Get initial participant count
-        initial_response = client.get("/activities")
+        initial_response = await client.get("/activities")
         initial_count = len(initial_response.json()[activity]["participants"])
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity.replace(' ', '%20')}/signup?email={email}")
+        signup_response = await client.post(f"/activities/{activity}/signup", params={"email": email})
         assert signup_response.status_code == 200
         
         # Verify signup
-        after_signup = client.get("/activities")
+        after_signup = await client.get("/activities")
         assert len(after_signup.json()[activity]["participants"]) == initial_count + 1
         assert email in after_signup.json()[activity]["participants"]
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity.replace(' ', '%20')}/unregister?email={email}")
+        unregister_response = await client.delete(f"/activities/{activity}/unregister", params={"email": email})
         assert unregister_response.status_code == 200
         
         # Verify unregister
-        after_unregister = client.get("/activities")
+        after_unregister = await client.get("/activities")
         assert len(after_unregister.json()[activity]["participants"]) == initial_count
         assert email not in after_unregister.json()[activity]["participants"]
     
-    def test_multiple_activities_same_user(self, client):
+    async def test_multiple_activities_same_user(self, client, reset_activities):
         """Test that a user can sign up for multiple different activities"""
         email = "multiactivity@mergington.edu"
         activities_list = ["Soccer Team", "Chess Club", "Art Club"]
         
         # Sign up for multiple activities
         for activity in activities_list:
-            response = client.post(f"/activities/{activity.replace(' ', '%20')}/signup?email={email}")
+            response = await client.post(f"/activities/{activity}/signup", params={"email": email})
             assert response.status_code == 200
         
         # Verify user is in all activities
-        all_activities = client.get("/activities").json()
         for activity in activities_list:
-            assert email in all_activities[activity]["participants"]
+            assert email in activities[activity]["participants"]